@@ -1,18 +1,27 @@
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
+MEASURE_COLUMNS = {
+    "liters": "Consumption of alcoholic beverages (in liters per capita)",
+    "pure_alcohol": "Consumption of alcoholic beverages (in liters of pure alcohol per capita)",
+}
 
-def load_and_prepare_data(
+BEVERAGES = ["wine", "beer", "vodka", "brandy"]
+
+
+def load_measures(
     filepath: str = "Consumption of alcoholic beverages in Russia 1998-2023.csv",
 ) -> DataFrame:
     """
-    Loads the alcohol consumption data from a CSV file and prepares it for analysis.
+    Loads both consumption measures from the CSV file with a single parse and pivot.
 
     Args:
         filepath (str, optional): The path to the CSV file. Defaults to "Consumption of alcoholic beverages in Russia 1998-2023.csv".
 
     Returns:
-        DataFrame: A pandas DataFrame with the prepared data.
+        DataFrame: A DataFrame with (Measure, Type) columns, where Measure is
+        "liters" or "pure_alcohol" and Type is the beverage.
     """
     df = pd.read_csv(filepath)
 
@@ -22,7 +31,7 @@ def load_and_prepare_data(
     df_pivot = df.pivot_table(
         index=df.index,
         columns="Type",
-        values="Consumption of alcoholic beverages (in liters per capita)",
+        values=list(MEASURE_COLUMNS.values()),
     )
 
     column_rename_map = {
@@ -31,15 +40,88 @@ def load_and_prepare_data(
         "Vodka and Liqueurs": "vodka",
         "Brandy": "brandy",
     }
-    df_pivot.rename(columns=column_rename_map, inplace=True)
+    measure_rename_map = {column: measure for measure, column in MEASURE_COLUMNS.items()}
+    df_pivot.rename(columns={**column_rename_map, **measure_rename_map}, inplace=True)
+    df_pivot.columns.names = ["Measure", "Type"]
 
-    # Explicitly create a copy to avoid SettingWithCopyWarning
-    final_df = df_pivot[["wine", "beer", "vodka", "brandy"]].copy()
-
-    # Use .loc to safely modify the DataFrame
-    for col in final_df.columns:
-        final_df.loc[:, col] = pd.to_numeric(final_df[col], errors="coerce")
+    # Measure-major column order so the values reshape into (measure, year, beverage)
+    final_df = df_pivot.reindex(
+        columns=pd.MultiIndex.from_product(
+            [list(MEASURE_COLUMNS), BEVERAGES], names=["Measure", "Type"]
+        )
+    )
+    final_df = final_df.apply(pd.to_numeric, errors="coerce")
 
     final_df.dropna(inplace=True)
 
-    return final_df
\ No newline at end of file
+    return final_df
+
+
+def load_and_prepare_data(
+    filepath: str = "Consumption of alcoholic beverages in Russia 1998-2023.csv",
+) -> DataFrame:
+    """
+    Loads the alcohol consumption data from a CSV file and prepares it for analysis.
+
+    Args:
+        filepath (str, optional): The path to the CSV file. Defaults to "Consumption of alcoholic beverages in Russia 1998-2023.csv".
+
+    Returns:
+        DataFrame: A pandas DataFrame with the prepared data.
+    """
+    return load_measures(filepath)["liters"]
+
+
+def stack_measures(df_measures: DataFrame) -> np.ndarray:
+    """
+    Stacks the measures of a `load_measures` DataFrame into one array.
+
+    Args:
+        df_measures (DataFrame): The DataFrame returned by `load_measures`.
+
+    Returns:
+        np.ndarray: A (measure, year, beverage) array of consumption values.
+    """
+    measures = df_measures.columns.get_level_values(0).unique()
+    beverages = df_measures.columns.get_level_values(1).unique()
+    expected = pd.MultiIndex.from_product([measures, beverages])
+    if not df_measures.columns.equals(expected):
+        raise ValueError(
+            "Columns must hold the same beverages for every measure, in "
+            f"measure-major order; expected {len(measures)} x {len(beverages)} "
+            f"columns, got {len(df_measures.columns)}."
+        )
+    values = df_measures.to_numpy(dtype=np.float64)
+    return np.ascontiguousarray(
+        values.reshape(len(df_measures), len(measures), len(beverages)).transpose(
+            1, 0, 2
+        )
+    )
+
+
+def compute_ethanol_aggregates(df_measures: DataFrame) -> DataFrame:
+    """
+    Computes total consumption across beverages and the implied alcohol strength.
+
+    Args:
+        df_measures (DataFrame): The DataFrame returned by `load_measures`.
+
+    Returns:
+        DataFrame: Total liters and total pure alcohol per capita, and the
+        implied alcohol by volume (ABV, in percent) of each beverage and overall.
+    """
+    stacked = stack_measures(df_measures)
+    totals = stacked.sum(axis=2, keepdims=True)
+    # Append the totals as an extra beverage so one division yields every ABV
+    with_totals = np.concatenate([stacked, totals], axis=2)
+    liters, pure_alcohol = with_totals
+    with np.errstate(divide="ignore", invalid="ignore"):
+        abv = 100 * pure_alcohol / liters
+    beverages = df_measures["liters"].columns
+    columns = ["total_liters", "total_pure_alcohol"]
+    columns += [f"abv_{beverage}" for beverage in beverages] + ["abv_total"]
+    return pd.DataFrame(
+        np.column_stack([liters[:, -1], pure_alcohol[:, -1], abv]),
+        index=df_measures.index,
+        columns=columns,
+    )
@@ -0,0 +1,205 @@
+import copy
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.series_container import SeriesContainer
+
+
+class DataStore:
+    """
+    An append-only store of prepared series, one per entity (e.g. a region).
+
+    New observations are appended in place into growable buffers instead of
+    reloading the CSV. Artifacts registered for an entity, such as a
+    `RecursiveVAR` or an `OnlineCorrelation`, are refreshed with just the new
+    rows, and cached results are invalidated only for the entity that changed.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[str, Tuple[np.ndarray, np.ndarray, List[str]]] = {}
+        self._lengths: Dict[str, int] = {}
+        self._artifacts: Dict[str, Dict[str, Tuple[Any, bool]]] = {}
+        self._cache: Dict[Tuple[str, str], Any] = {}
+
+    @classmethod
+    def from_csv(
+        cls,
+        filepath: str = "Consumption of alcoholic beverages in Russia 1998-2023.csv",
+        entity: str = "russia",
+    ) -> "DataStore":
+        """
+        Creates a store holding the prepared data of one CSV file.
+
+        Args:
+            filepath (str, optional): The path to the CSV file. Defaults to "Consumption of alcoholic beverages in Russia 1998-2023.csv".
+            entity (str, optional): The name of the entity. Defaults to "russia".
+
+        Returns:
+            DataStore: The populated store.
+        """
+        store = cls()
+        store.add_entity(
+            entity, SeriesContainer.from_dataframe(load_and_prepare_data(filepath))
+        )
+        return store
+
+    @property
+    def entities(self) -> List[str]:
+        return list(self._buffers)
+
+    def add_entity(self, entity: str, series: SeriesContainer):
+        """
+        Adds the initial series of a new entity.
+
+        Args:
+            entity (str): The name of the entity.
+            series (SeriesContainer): Its prepared series.
+        """
+        if entity in self._buffers:
+            raise ValueError(f"Entity '{entity}' already exists; use append instead.")
+        self._buffers[entity] = (
+            np.array(series.values, dtype=np.float64),
+            series.years.copy(),
+            list(series.columns),
+        )
+        self._lengths[entity] = len(series)
+        self._artifacts[entity] = {}
+
+    def get(self, entity: str) -> SeriesContainer:
+        """
+        Returns a view of the stored series of an entity.
+
+        Args:
+            entity (str): The name of the entity.
+
+        Returns:
+            SeriesContainer: The series, sharing memory with the store.
+        """
+        values, years, columns = self._buffers[entity]
+        n = self._lengths[entity]
+        return SeriesContainer(values[:n], years[:n], columns)
+
+    def register(
+        self, entity: str, name: str, artifact: Any, differenced: bool = False
+    ):
+        """
+        Registers an artifact that is refreshed incrementally on every append.
+
+        The artifact must already reflect the entity's current data and
+        provide `update(series: SeriesContainer)`, which is then called with
+        only the appended rows.
+
+        Args:
+            entity (str): The name of the entity.
+            name (str): The name of the artifact.
+            artifact: The artifact to keep up to date.
+            differenced (bool, optional): Feed first differences instead of
+                levels. Defaults to False.
+        """
+        self._artifacts[entity][name] = (artifact, differenced)
+
+    def artifact(self, entity: str, name: str) -> Any:
+        """
+        Returns a registered artifact.
+
+        Args:
+            entity (str): The name of the entity.
+            name (str): The name of the artifact.
+
+        Returns:
+            The artifact.
+        """
+        return self._artifacts[entity][name][0]
+
+    def has_artifact(self, entity: str, name: str) -> bool:
+        """
+        Checks whether an artifact is registered for an entity.
+
+        Args:
+            entity (str): The name of the entity.
+            name (str): The name of the artifact.
+
+        Returns:
+            bool: True if the artifact is registered.
+        """
+        return name in self._artifacts[entity]
+
+    def cached(
+        self, entity: str, name: str, compute: Callable[[SeriesContainer], Any]
+    ) -> Any:
+        """
+        Returns a cached result, computing it from the entity's series if needed.
+
+        Args:
+            entity (str): The name of the entity.
+            name (str): The name of the result.
+            compute (Callable[[SeriesContainer], Any]): Builds the result.
+
+        Returns:
+            The cached result, valid until the entity's next append.
+        """
+        key = (entity, name)
+        if key not in self._cache:
+            self._cache[key] = compute(self.get(entity))
+        return self._cache[key]
+
+    def append(self, entity: str, series: SeriesContainer):
+        """
+        Appends new observations to an entity and refreshes what depends on it.
+
+        Registered artifacts are updated before the rows are stored. If any
+        update raises, every artifact of the entity is restored from a
+        snapshot (fetch artifacts through `artifact`) and the store is left
+        unchanged, so models never miss rows that the store holds.
+
+        Args:
+            entity (str): The name of the entity.
+            series (SeriesContainer): The new rows, following the stored years.
+        """
+        if len(series) == 0:
+            return
+        values, years, columns = self._buffers[entity]
+        if series.columns != columns:
+            series = series.select(columns)
+        n = self._lengths[entity]
+        if n and series.years[0] <= years[n - 1]:
+            raise ValueError(
+                f"New observations must start after {years[n - 1]}, "
+                f"got {series.years[0]}."
+            )
+
+        artifacts = self._artifacts[entity]
+        snapshots = {name: copy.deepcopy(entry) for name, entry in artifacts.items()}
+        try:
+            for artifact, differenced in artifacts.values():
+                if differenced and n == 0:
+                    artifact.update(series.diff())
+                elif differenced:
+                    # Prepend the previous last row so the first difference is defined
+                    overlap = SeriesContainer(
+                        np.concatenate([values[n - 1 : n], series.values]),
+                        np.concatenate([years[n - 1 : n], series.years]),
+                        columns,
+                    )
+                    artifact.update(overlap.diff())
+                else:
+                    artifact.update(series)
+        except Exception:
+            self._artifacts[entity] = snapshots
+            raise
+
+        n_new = n + len(series)
+        if n_new > len(values):
+            # Grow geometrically so repeated appends stay amortised O(rows)
+            capacity = max(n_new, 2 * len(values))
+            values = np.resize(values, (capacity, len(columns)))
+            years = np.resize(years, capacity)
+            self._buffers[entity] = (values, years, columns)
+        values[n:n_new] = series.values
+        years[n:n_new] = series.years
+        self._lengths[entity] = n_new
+
+        for key in [key for key in self._cache if key[0] == entity]:
+            del self._cache[key]
@@ -1,10 +1,13 @@
 from statsmodels.tsa.api import VAR
 from statsmodels.tsa.stattools import grangercausalitytests
 from statsmodels.tsa.vector_ar.var_model import VARResults
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 from typing import Dict, Tuple, List
 
+from analysis_lib.series_container import SeriesContainer
+
 
 def train_var_model(df: DataFrame) -> VARResults:
     """
@@ -35,16 +38,222 @@ def generate_forecast(fitted_model: VARResults, steps: int = 5) -> DataFrame:
     lag_order = fitted_model.k_ar
     forecast_input = fitted_model.model.endog[-lag_order:]
     forecast = fitted_model.forecast(y=forecast_input, steps=steps)
-    last_date = fitted_model.model.data.dates[-1]
-    forecast_index = pd.date_range(
-        start=last_date + pd.DateOffset(years=1), periods=steps, freq="A"
-    )
     forecast_df = pd.DataFrame(
-        forecast, index=forecast_index, columns=fitted_model.model.endog_names
+        forecast,
+        index=get_forecast_index(fitted_model, steps),
+        columns=fitted_model.model.endog_names,
     )
     return forecast_df
 
 
+def get_forecast_index(fitted_model: VARResults, steps: int) -> pd.DatetimeIndex:
+    """
+    Builds the yearly date index that follows the last observation of a fitted model.
+
+    Args:
+        fitted_model (VARResults): The fitted VAR model.
+        steps (int): The number of forecast steps.
+
+    Returns:
+        pd.DatetimeIndex: The index of the forecast horizon.
+    """
+    return _yearly_forecast_index(fitted_model.model.data.dates[-1].year, steps)
+
+
+def _yearly_forecast_index(last_year: int, steps: int) -> pd.DatetimeIndex:
+    # Year-end stamps for the `steps` years after `last_year`
+    return pd.date_range(
+        start=pd.Timestamp(year=last_year + 1, month=1, day=1),
+        periods=steps,
+        freq="A",
+    )
+
+
+def train_varx_model(df: DataFrame, exog: DataFrame, lags: int = 1) -> VARResults:
+    """
+    Trains a VAR model with exogenous regressors (VARX) on the provided data.
+
+    Args:
+        df (DataFrame): The endogenous series used for training.
+        exog (DataFrame): The exogenous series aligned with `df`, e.g. policy dummies.
+        lags (int, optional): The lag order of the model. Defaults to 1.
+
+    Returns:
+        VARResults: The fitted VARX model.
+    """
+    model = VAR(df, exog=exog)
+    fitted_model = model.fit(lags)
+    return fitted_model
+
+
+def build_covid_exog(index: pd.DatetimeIndex) -> DataFrame:
+    """
+    Builds the COVID-19 exogenous regressor used by every VARX model.
+
+    The regressor is a level dummy that is 1.0 in every year from 2020 onwards,
+    so on differenced data its coefficient is the shift in annual consumption
+    changes while the COVID-19 regime is in effect. A scenario value of 1.0
+    therefore means "a COVID-19 sized regime in effect in that year".
+
+    Args:
+        index (pd.DatetimeIndex): The yearly index of the (differenced) data.
+
+    Returns:
+        DataFrame: A single "covid" column aligned with `index`.
+    """
+    return pd.DataFrame(
+        {"covid": np.where(index.year >= 2020, 1.0, 0.0)}, index=index
+    )
+
+
+def build_shock_scenarios(
+    intensities: np.ndarray, steps: int, start_step: int = 1
+) -> np.ndarray:
+    """
+    Builds exogenous paths for a shock of each intensity that starts in a given
+    forecast year and stays in effect, matching `build_covid_exog`.
+
+    Args:
+        intensities (np.ndarray): The shock size of each scenario, where 1.0
+            is a COVID-19 sized regime.
+        steps (int): The number of forecast steps.
+        start_step (int, optional): The first forecast step (1-based) in which
+            the shock is in effect. Defaults to 1.
+
+    Returns:
+        np.ndarray: The (scenarios, steps, 1) exogenous paths.
+    """
+    active = (np.arange(steps) >= start_step - 1).astype(float)
+    return (np.asarray(intensities, dtype=float)[:, None] * active[None, :])[
+        :, :, None
+    ]
+
+
+def simulate_exog_scenarios(
+    fitted_model: VARResults, exog_scenarios: np.ndarray
+) -> np.ndarray:
+    """
+    Forecasts a fitted VARX model under many exogenous scenarios at once.
+
+    The model is fitted once and the forecast recursion runs over the horizon
+    only, with every scenario advanced together as one batched matrix product.
+
+    Args:
+        fitted_model (VARResults): A VARX model fitted with a constant trend.
+        exog_scenarios (np.ndarray): Exogenous paths shaped
+            (scenarios, steps, exog variables). A single (steps, exog variables)
+            path is treated as one scenario.
+
+    Returns:
+        np.ndarray: The forecasts shaped (scenarios, steps, endogenous variables).
+    """
+    exog_scenarios = np.asarray(exog_scenarios, dtype=float)
+    if exog_scenarios.ndim == 2:
+        exog_scenarios = exog_scenarios[np.newaxis]
+    if exog_scenarios.ndim != 3:
+        raise ValueError("exog_scenarios must be shaped (scenarios, steps, exog).")
+
+    if fitted_model.trend not in ("c", "n"):
+        raise ValueError("Only models with a constant or no trend are supported.")
+
+    k_trend = fitted_model.k_trend
+    k_exog = fitted_model.k_exog_user
+    if exog_scenarios.shape[2] != k_exog:
+        raise ValueError(
+            f"Expected {k_exog} exogenous variables, got {exog_scenarios.shape[2]}."
+        )
+
+    params = np.asarray(fitted_model.params)
+    intercept = params[:k_trend].sum(axis=0)
+    exog_coefs = params[k_trend : k_trend + k_exog]
+    # Stacked lag coefficients, most recent lag first: (k_ar * neqs, neqs)
+    lag_coefs = params[k_trend + k_exog :]
+
+    n_scenarios, steps, _ = exog_scenarios.shape
+    lag_order = fitted_model.k_ar
+    neqs = fitted_model.neqs
+
+    # Exogenous and deterministic contributions for every scenario and step
+    forecasts = intercept + exog_scenarios @ exog_coefs
+
+    history = np.asarray(fitted_model.model.endog[-lag_order:])[::-1].reshape(-1)
+    state = np.broadcast_to(history, (n_scenarios, lag_order * neqs))
+    return _iterate_var(forecasts, state, lag_coefs)
+
+
+def _iterate_var(
+    forecasts: np.ndarray, state: np.ndarray, lag_coefs: np.ndarray
+) -> np.ndarray:
+    """
+    Runs the VAR forecast recursion for a batch of independent forecasts.
+
+    Args:
+        forecasts (np.ndarray): (batch, steps, neqs) deterministic and exogenous
+            contributions; the lag contributions are added in place.
+        state (np.ndarray): (batch, lags * neqs) last observations, most recent first.
+        lag_coefs (np.ndarray): (lags * neqs, neqs) or (batch, lags * neqs, neqs)
+            stacked lag coefficients, most recent lag first.
+
+    Returns:
+        np.ndarray: The completed (batch, steps, neqs) forecasts.
+    """
+    neqs = forecasts.shape[2]
+    state = state.copy()
+    for step in range(forecasts.shape[1]):
+        forecasts[:, step] += (state[:, np.newaxis, :] @ lag_coefs)[:, 0]
+        state = np.roll(state, neqs, axis=1)
+        state[:, :neqs] = forecasts[:, step]
+    return forecasts
+
+
+def train_var_batch(stacked: np.ndarray, lags: int = 1) -> np.ndarray:
+    """
+    Fits one VAR model with a constant per panel of a stacked array in a single
+    batched least-squares solve, e.g. both consumption measures at once.
+
+    Args:
+        stacked (np.ndarray): A (batch, years, variables) array such as the
+            output of `stack_measures`.
+        lags (int, optional): The lag order of the models. Defaults to 1.
+
+    Returns:
+        np.ndarray: (batch, 1 + lags * variables, variables) coefficients laid
+        out like `VARResults.params`: the constant, then L1, L2, ... terms.
+    """
+    stacked = np.asarray(stacked, dtype=float)
+    return np.linalg.pinv(_var_design(stacked, lags)) @ stacked[:, lags:]
+
+
+def _var_design(stacked: np.ndarray, lags: int) -> np.ndarray:
+    # (batch, years - lags, 1 + lags * variables) regressors: constant, L1, L2, ...
+    n_obs = stacked.shape[1]
+    regressors = [np.ones(stacked.shape[:1] + (n_obs - lags, 1))]
+    regressors += [stacked[:, lags - lag : n_obs - lag] for lag in range(1, lags + 1)]
+    return np.concatenate(regressors, axis=2)
+
+
+def forecast_var_batch(
+    stacked: np.ndarray, params: np.ndarray, steps: int = 5
+) -> np.ndarray:
+    """
+    Forecasts every panel of a stacked array with its `train_var_batch` coefficients.
+
+    Args:
+        stacked (np.ndarray): The (batch, years, variables) array the models were fitted on.
+        params (np.ndarray): The coefficients returned by `train_var_batch`.
+        steps (int, optional): The number of steps to forecast. Defaults to 5.
+
+    Returns:
+        np.ndarray: The (batch, steps, variables) forecasts.
+    """
+    stacked = np.asarray(stacked, dtype=float)
+    n_batch, _, neqs = stacked.shape
+    lags = (params.shape[1] - 1) // neqs
+    forecasts = np.repeat(params[:, np.newaxis, 0, :], steps, axis=1)
+    state = stacked[:, -lags:][:, ::-1].reshape(n_batch, lags * neqs)
+    return _iterate_var(forecasts, state, params[:, 1:])
+
+
 def get_granger_causality_results(
     df: DataFrame, variables: List[str], max_lag: int = 1
 ) -> Dict[Tuple[str, str], float]:
@@ -68,4 +277,103 @@ def get_granger_causality_results(
                 )
                 p_value = test_result[max_lag][0]["ssr_ftest"][1]
                 test_results[(var1, var2)] = p_value
-    return test_results
\ No newline at end of file
+    return test_results
+
+
+class RecursiveVAR:
+    """
+    A VAR model with a constant whose coefficients are kept up to date by
+    recursive least squares (RLS) as new observations arrive.
+
+    Each appended row is folded in with a Sherman-Morrison update of the
+    inverse moment matrix, so the coefficients stay equal to an OLS refit on
+    the full history without ever refitting it.
+    """
+
+    def __init__(
+        self,
+        params: np.ndarray,
+        inverse_moments: np.ndarray,
+        history: np.ndarray,
+        last_year: int,
+        columns: List[str],
+    ):
+        """
+        Args:
+            params (np.ndarray): (1 + lags * variables, variables) coefficients
+                laid out like `VARResults.params`.
+            inverse_moments (np.ndarray): The inverse of the regressors' X'X matrix.
+            history (np.ndarray): The last `lags` observations, oldest first.
+            last_year (int): The year of the last observation.
+            columns (List[str]): The variable names.
+        """
+        self.params = params
+        self.inverse_moments = inverse_moments
+        self.history = history
+        self.last_year = last_year
+        self.columns = list(columns)
+
+    @classmethod
+    def from_series(cls, series: SeriesContainer, lags: int = 1) -> "RecursiveVAR":
+        """
+        Fits the initial model by least squares on a series.
+
+        Args:
+            series (SeriesContainer): The training data.
+            lags (int, optional): The lag order of the model. Defaults to 1.
+
+        Returns:
+            RecursiveVAR: The fitted model.
+        """
+        values = np.asarray(series.values, dtype=float)
+        params = train_var_batch(values[np.newaxis], lags)[0]
+        design = _var_design(values[np.newaxis], lags)[0]
+        inverse_moments = np.linalg.pinv(design.T @ design)
+        return cls(
+            params,
+            inverse_moments,
+            values[-lags:].copy(),
+            int(series.years[-1]),
+            series.columns,
+        )
+
+    @property
+    def k_ar(self) -> int:
+        return len(self.history)
+
+    def update(self, series: SeriesContainer):
+        """
+        Folds new observations into the coefficients by recursive least squares.
+
+        Args:
+            series (SeriesContainer): The rows following the last observation.
+        """
+        if len(series) == 0:
+            return
+        for row in np.asarray(series.values, dtype=float):
+            regressors = np.concatenate([[1.0], self.history[::-1].reshape(-1)])
+            gain_direction = self.inverse_moments @ regressors
+            gain = gain_direction / (1.0 + regressors @ gain_direction)
+            self.params += np.outer(gain, row - regressors @ self.params)
+            self.inverse_moments -= np.outer(gain, gain_direction)
+            self.history = np.concatenate([self.history[1:], row[np.newaxis]])
+        self.last_year = int(series.years[-1])
+
+    def forecast(self, steps: int = 5) -> DataFrame:
+        """
+        Generates a forecast from the last observations.
+
+        Args:
+            steps (int, optional): The number of steps to forecast. Defaults to 5.
+
+        Returns:
+            DataFrame: A DataFrame with the forecasted values.
+        """
+        forecasts = forecast_var_batch(
+            self.history[np.newaxis], self.params[np.newaxis], steps
+        )
+        return pd.DataFrame(
+            forecasts[0],
+            index=_yearly_forecast_index(self.last_year, steps),
+            columns=self.columns,
+        )
@@ -0,0 +1,211 @@
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from statsmodels.tsa.seasonal import DecomposeResult
+
+from analysis_lib.series_container import SeriesContainer
+
+
+class OnlineCorrelation:
+    """
+    Maintains an expanding or rolling correlation matrix.
+
+    Expanding windows are updated online with Welford-style running means and
+    co-moments. Rolling windows are not online: each new row recomputes the
+    co-moments of its window from the buffered rows, in O(window * columns^2),
+    which avoids the rounding residue of downdating and suits short windows.
+
+    Every call to `update` only processes the new rows and appends one matrix
+    per row to the stored history, so refreshing after new data arrives
+    reuses all previously computed matrices.
+    """
+
+    def __init__(self, columns, window: Optional[int] = None):
+        """
+        Args:
+            columns: The names of the tracked series.
+            window (int, optional): The rolling window length in rows. Defaults
+                to None, which gives an expanding window.
+        """
+        if window is not None and window < 2:
+            raise ValueError("window must be at least 2.")
+        self.columns = list(columns)
+        self.window = window
+        k = len(self.columns)
+        self._count = 0
+        self._mean = np.zeros(k)
+        self._comoment = np.zeros((k, k))
+        self._buffer = np.empty((0, k))
+        self.years = np.empty(0, dtype=np.int64)
+        self.matrices = np.empty((0, k, k))
+
+    def _add(self, row: np.ndarray):
+        self._count += 1
+        delta = row - self._mean
+        self._mean += delta / self._count
+        self._comoment += np.outer(delta, row - self._mean)
+
+    def _rebuild(self, rows: np.ndarray):
+        # Downdating a removed row leaves rounding residue that turns a
+        # constant window into a tiny (or negative) variance, so rolling
+        # windows recompute their co-moments from the buffered rows instead
+        self._count = len(rows)
+        self._mean = rows.mean(axis=0)
+        centered = rows - self._mean
+        self._comoment = centered.T @ centered
+
+    def _correlation(self) -> np.ndarray:
+        if self._count < (self.window or 2):
+            return np.full(self._comoment.shape, np.nan)
+        variance = np.diag(self._comoment)
+        # A variance that is only rounding noise relative to the values' size
+        # (e.g. a window of equal differences) is treated as exactly zero
+        sum_squares = variance + self._count * self._mean**2
+        scale = np.sqrt(variance)
+        scale[variance <= 1e-12 * sum_squares] = np.nan
+        return self._comoment / np.outer(scale, scale)
+
+    def update(self, series: SeriesContainer) -> np.ndarray:
+        """
+        Appends new observations and computes their correlation matrices.
+
+        Args:
+            series (SeriesContainer): The new rows, with the tracked columns.
+
+        Returns:
+            np.ndarray: A (new rows, columns, columns) stack of matrices.
+        """
+        if series.columns != self.columns:
+            series = series.select(self.columns)
+        values = np.asarray(series.values, dtype=np.float64)
+
+        new_matrices = np.empty((len(values),) + self._comoment.shape)
+        if self.window is not None:
+            self._buffer = np.concatenate([self._buffer, values])
+            first_new = len(self._buffer) - len(values)
+        for i, row in enumerate(values):
+            if self.window is None:
+                self._add(row)
+            else:
+                end = first_new + i + 1
+                self._rebuild(self._buffer[max(end - self.window, 0) : end])
+            new_matrices[i] = self._correlation()
+        if self.window is not None:
+            self._buffer = self._buffer[-self.window :]
+
+        self.years = np.concatenate([self.years, series.years])
+        self.matrices = np.concatenate([self.matrices, new_matrices])
+        return new_matrices
+
+    def latest(self) -> DataFrame:
+        """
+        Returns the most recent correlation matrix.
+
+        Returns:
+            DataFrame: The correlation matrix labelled by column name.
+        """
+        return pd.DataFrame(self.matrices[-1], index=self.columns, columns=self.columns)
+
+
+class OnlineTrendDecomposition:
+    """
+    Maintains an additive moving-average decomposition of several series that
+    matches `seasonal_decompose(..., model="additive", period=period)`.
+
+    Appending rows only evaluates the moving average at the positions whose
+    window has just become complete, and keeps running per-phase sums of the
+    detrended values so the seasonal component is refreshed in O(period).
+    """
+
+    def __init__(self, columns, period: int = 1):
+        """
+        Args:
+            columns: The names of the tracked series.
+            period (int, optional): The seasonal period. Defaults to 1.
+        """
+        self.columns = list(columns)
+        self.period = period
+        if period % 2 == 0:
+            self._filter = np.array([0.5] + [1.0] * (period - 1) + [0.5]) / period
+        else:
+            self._filter = np.repeat(1.0 / period, period)
+        self._half = len(self._filter) // 2
+        k = len(self.columns)
+        self.years = np.empty(0, dtype=np.int64)
+        self.observed = np.empty((0, k))
+        self.trend = np.empty((0, k))
+        self._phase_sums = np.zeros((period, k))
+        self._phase_counts = np.zeros((period, 1))
+
+    def update(self, series: SeriesContainer):
+        """
+        Appends new observations and extends the trend where it is now defined.
+
+        Args:
+            series (SeriesContainer): The new rows, with the tracked columns.
+        """
+        if series.columns != self.columns:
+            series = series.select(self.columns)
+        n_old = len(self.observed)
+        self.observed = np.concatenate([self.observed, series.values])
+        self.years = np.concatenate([self.years, series.years])
+        n_new = len(self.observed)
+
+        self.trend = np.concatenate(
+            [self.trend, np.full((n_new - n_old, len(self.columns)), np.nan)]
+        )
+        # Only centres whose full window lies in the data, and were not already
+        # complete before this update, need to be evaluated
+        start = max(n_old - self._half, self._half)
+        stop = n_new - self._half
+        if stop <= start:
+            return
+        windows = np.lib.stride_tricks.sliding_window_view(
+            self.observed[start - self._half : stop + self._half],
+            len(self._filter),
+            axis=0,
+        )
+        self.trend[start:stop] = windows @ self._filter
+
+        detrended = self.observed[start:stop] - self.trend[start:stop]
+        phases = np.arange(start, stop) % self.period
+        np.add.at(self._phase_sums, phases, detrended)
+        np.add.at(self._phase_counts, phases, 1)
+
+    def seasonal(self) -> np.ndarray:
+        """
+        Returns the seasonal component for every stored row.
+
+        Returns:
+            np.ndarray: A (rows, columns) array of seasonal values.
+        """
+        with np.errstate(invalid="ignore"):
+            averages = self._phase_sums / self._phase_counts
+        averages -= averages.mean(axis=0)
+        reps = len(self.observed) // self.period + 1
+        return np.tile(averages, (reps, 1))[: len(self.observed)]
+
+    def result(self, column: str) -> DecomposeResult:
+        """
+        Builds a statsmodels decomposition result for one series.
+
+        Args:
+            column (str): The name of the series.
+
+        Returns:
+            DecomposeResult: The observed, trend, seasonal and residual series.
+        """
+        i = self.columns.index(column)
+        index = pd.DatetimeIndex(
+            pd.to_datetime(self.years.astype(str), format="%Y"), name="Year"
+        )
+        seasonal = self.seasonal()[:, i]
+        detrended = self.observed[:, i] - self.trend[:, i]
+        return DecomposeResult(
+            observed=pd.Series(self.observed[:, i], index=index, name=column),
+            seasonal=pd.Series(seasonal, index=index, name="seasonal"),
+            trend=pd.Series(self.trend[:, i], index=index, name="trend"),
+            resid=pd.Series(detrended - seasonal, index=index, name="resid"),
+        )
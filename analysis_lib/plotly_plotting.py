@@ -1,8 +1,11 @@
+from typing import List, Optional
+
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
-from pandas import DataFrame, Series
-from statsmodels.tsa.seasonal import seasonal_decompose
+import numpy as np
+from pandas import DataFrame, DatetimeIndex, Series
+from statsmodels.tsa.seasonal import DecomposeResult, seasonal_decompose
 from statsmodels.tsa.vector_ar.var_model import VARResultsWrapper
 
 
@@ -55,9 +58,14 @@ def plotly_forecast(original_df: DataFrame, forecast_df: DataFrame) -> go.Figure
     return fig
 
 
-def plotly_correlation_heatmap(df: DataFrame) -> go.Figure:
-    """Generates an interactive correlation heatmap using Plotly."""
-    corr = df.corr()
+def plotly_correlation_heatmap(
+    df: Optional[DataFrame] = None, corr: Optional[DataFrame] = None
+) -> go.Figure:
+    """Generates an interactive correlation heatmap of `df`, or of `corr` when given."""
+    if corr is None:
+        if df is None:
+            raise ValueError("Provide either df or corr.")
+        corr = df.corr()
     fig = px.imshow(
         corr,
         text_auto=True,
@@ -69,9 +77,35 @@ def plotly_correlation_heatmap(df: DataFrame) -> go.Figure:
     return fig
 
 
-def plotly_trend_decomposition(series: Series, series_name: str) -> go.Figure:
-    """Generates an interactive trend decomposition plot using Plotly."""
-    decomposition = seasonal_decompose(series, model="additive", period=1)
+def plotly_animated_correlation_heatmap(
+    matrices: np.ndarray, years: np.ndarray, columns: List[str]
+) -> go.Figure:
+    """Generates a correlation heatmap animated over a time-indexed stack of matrices."""
+    valid = ~np.isnan(matrices).all(axis=(1, 2))
+    fig = px.imshow(
+        np.round(matrices[valid], 2),
+        x=columns,
+        y=columns,
+        animation_frame=0,
+        text_auto=True,
+        aspect="auto",
+        color_continuous_scale="RdBu",
+        zmin=-1,
+        zmax=1,
+        title="Correlation Matrix of Annual Consumption Changes Over Time",
+    )
+    for step, year in zip(fig.layout.sliders[0].steps, years[valid]):
+        step.label = str(year)
+    fig.layout.sliders[0].currentvalue.prefix = "Year: "
+    return fig
+
+
+def plotly_trend_decomposition(
+    series: Series, series_name: str, decomposition: Optional[DecomposeResult] = None
+) -> go.Figure:
+    """Generates an interactive trend decomposition plot, reusing `decomposition` when given."""
+    if decomposition is None:
+        decomposition = seasonal_decompose(series, model="additive", period=1)
     fig = make_subplots(
         rows=3,
         cols=1,
@@ -179,4 +213,81 @@ def plotly_what_if_forecast(
     fig.update_layout(
         title_text="What-If Scenario Forecast Comparison", height=600
     )
-    return fig
\ No newline at end of file
+    return fig
+
+
+def plotly_scenario_fan(
+    original_df: DataFrame, scenario_forecasts: np.ndarray, forecast_index: DatetimeIndex
+) -> go.Figure:
+    """Generates an interactive fan chart summarizing a batch of scenario forecasts."""
+    fig = make_subplots(
+        rows=2,
+        cols=2,
+        subplot_titles=[col.title() for col in original_df.columns],
+        shared_xaxes=True,
+    )
+    low, median, high = np.percentile(scenario_forecasts, [5, 50, 95], axis=0)
+    row, col = 1, 1
+    for i, column in enumerate(original_df.columns):
+        fig.add_trace(
+            go.Scatter(
+                x=original_df.index,
+                y=original_df[column],
+                name="Historical",
+                mode="lines",
+                legendgroup="Historical",
+                showlegend=(i == 0),
+                line=dict(color="blue"),
+            ),
+            row=row,
+            col=col,
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=forecast_index,
+                y=high[:, i],
+                mode="lines",
+                legendgroup="Range",
+                showlegend=False,
+                line=dict(width=0),
+            ),
+            row=row,
+            col=col,
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=forecast_index,
+                y=low[:, i],
+                name="5-95% Scenario Range",
+                mode="lines",
+                legendgroup="Range",
+                showlegend=(i == 0),
+                fill="tonexty",
+                fillcolor="rgba(255, 0, 0, 0.2)",
+                line=dict(width=0),
+            ),
+            row=row,
+            col=col,
+        )
+        fig.add_trace(
+            go.Scatter(
+                x=forecast_index,
+                y=median[:, i],
+                name="Median Scenario",
+                mode="lines",
+                legendgroup="Median",
+                showlegend=(i == 0),
+                line=dict(color="red", dash="dash"),
+            ),
+            row=row,
+            col=col,
+        )
+        col += 1
+        if col > 2:
+            col = 1
+            row += 1
+
+    fig.update_layout(
+        title_text="Policy Scenario Forecasts", height=600, legend_tracegroupgap=180
+    )
+    return fig
@@ -1,6 +1,8 @@
+from typing import Optional
+
 import matplotlib.pyplot as plt
 import seaborn as sns
-from statsmodels.tsa.seasonal import seasonal_decompose
+from statsmodels.tsa.seasonal import DecomposeResult, seasonal_decompose
 from pandas import DataFrame, Series
 from statsmodels.tsa.vector_ar.var_model import VARResults
 from matplotlib.figure import Figure
@@ -40,18 +42,26 @@ def plot_forecast(original_df: DataFrame, forecast_df: DataFrame) -> Figure:
     return fig
 
 
-def plot_correlation_heatmap(df: DataFrame) -> Figure:
+def plot_correlation_heatmap(
+    df: Optional[DataFrame] = None, correlation_matrix: Optional[DataFrame] = None
+) -> Figure:
     """
     Plots a correlation heatmap for the DataFrame.
 
     Args:
-        df (DataFrame): The input DataFrame.
+        df (DataFrame, optional): The input DataFrame. Defaults to None.
+        correlation_matrix (DataFrame, optional): A precomputed correlation
+            matrix, e.g. from `OnlineCorrelation.latest`, used instead of
+            `df`. Defaults to None.
 
     Returns:
         Figure: The matplotlib Figure object.
     """
+    if correlation_matrix is None:
+        if df is None:
+            raise ValueError("Provide either df or correlation_matrix.")
+        correlation_matrix = df.corr()
     fig, ax = plt.subplots(figsize=(10, 8))
-    correlation_matrix = df.corr()
     sns.heatmap(correlation_matrix, annot=True, cmap="coolwarm", fmt=".2f", ax=ax)
     ax.set_title("Correlation Matrix of Alcohol Consumption Types")
     return fig
@@ -83,18 +93,40 @@ def plot_residuals(fitted_model: VARResults) -> Figure:
     return fig
 
 
-def plot_trend_decomposition(series: Series, series_name: str) -> Figure:
+def plot_impulse_response(fitted_model: VARResults, steps: int = 10) -> Figure:
+    """
+    Plots the impulse response functions of a fitted VAR model.
+
+    Args:
+        fitted_model (VARResults): The fitted VAR model.
+        steps (int, optional): The number of periods to trace. Defaults to 10.
+
+    Returns:
+        Figure: The matplotlib Figure object.
+    """
+    irf = fitted_model.irf(steps)
+    fig = irf.plot(orth=False)
+    fig.suptitle("Impulse Response Functions", fontsize=16)
+    return fig
+
+
+def plot_trend_decomposition(
+    series: Series, series_name: str, decomposition: Optional[DecomposeResult] = None
+) -> Figure:
     """
     Plots the trend, seasonal, and residual components of a time series.
 
     Args:
         series (Series): The time series to decompose.
         series_name (str): The name of the time series.
+        decomposition (DecomposeResult, optional): A precomputed decomposition,
+            e.g. from `OnlineTrendDecomposition.result`. Defaults to None.
 
     Returns:
         Figure: The matplotlib Figure object.
     """
-    decomposition = seasonal_decompose(series, model="additive", period=1)
+    if decomposition is None:
+        decomposition = seasonal_decompose(series, model="additive", period=1)
 
     fig, (ax1, ax2, ax3) = plt.subplots(3, 1, figsize=(12, 8), sharex=True)
     fig.suptitle(f"Trend Decomposition for {series_name.title()}", fontsize=16)
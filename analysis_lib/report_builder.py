@@ -0,0 +1,397 @@
+import hashlib
+import os
+import pickle
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from html import escape
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+from plotly.offline import get_plotlyjs
+from statsmodels.tsa.stattools import adfuller
+
+from analysis_lib.data_store import DataStore
+from analysis_lib.forecasting_models import (
+    RecursiveVAR,
+    train_var_model,
+    generate_forecast,
+    train_varx_model,
+    build_covid_exog,
+)
+from analysis_lib.plotly_plotting import (
+    plotly_backtesting,
+    plotly_correlation_heatmap,
+    plotly_forecast,
+)
+from analysis_lib.series_container import SeriesContainer
+
+SECTIONS = ("eda", "forecast", "backtest", "irf", "varx")
+
+SECTION_TITLES = {
+    "eda": "Exploratory Data Analysis",
+    "forecast": "Consumption Forecast",
+    "backtest": "Backtesting and Validation",
+    "irf": "Impulse Response Functions",
+    "varx": "COVID-19 Exogenous Shock (VARX)",
+}
+
+# The fitted models each section reads, so every model is fitted once per
+# entity and shared by the sections, formats and horizons that need it
+SECTION_MODELS = {
+    "eda": (),
+    "forecast": ("levels",),
+    "backtest": ("backtest",),
+    "irf": ("changes",),
+    "varx": ("varx",),
+}
+
+# A `RecursiveVAR` registered in the store under this name is used as the
+# "levels" model, so the forecast follows appends without refitting
+LEVELS_ARTIFACT = "var"
+
+
+def fit_model(name: str, series: SeriesContainer) -> Any:
+    """
+    Fits one of the models listed in `SECTION_MODELS`.
+
+    Args:
+        name (str): "levels", "changes", "backtest" or "varx".
+        series (SeriesContainer): The entity's prepared series.
+
+    Returns:
+        The fitted model.
+    """
+    if name == "levels":
+        return RecursiveVAR.from_series(series)
+    if name == "backtest":
+        train, _ = series.split(2019)
+        return train_var_model(train.to_dataframe())
+    df_diff = series.diff().to_dataframe()
+    if name == "changes":
+        return train_var_model(df_diff)
+    if name == "varx":
+        return train_varx_model(df_diff, build_covid_exog(df_diff.index))
+    raise ValueError(f"Unknown report model '{name}'.")
+
+
+def compute_section(
+    section: str,
+    series: SeriesContainer,
+    steps: int = 5,
+    models: Optional[Dict[str, Any]] = None,
+) -> Tuple[Dict[str, DataFrame], list]:
+    """
+    Computes the tables and figures of one report section.
+
+    Args:
+        section (str): One of `SECTIONS`.
+        series (SeriesContainer): The entity's prepared series.
+        steps (int, optional): The forecast and IRF horizon. Defaults to 5.
+        models (Dict[str, Any], optional): Fitted models by name, holding at
+            least those in `SECTION_MODELS[section]`. Defaults to None, which
+            fits them here.
+
+    Returns:
+        Tuple[Dict[str, DataFrame], list]: The section's tables by title and
+        its Plotly figures.
+    """
+    if models is None:
+        models = {
+            name: fit_model(name, series) for name in SECTION_MODELS.get(section, ())
+        }
+    df = series.to_dataframe()
+    df_diff = series.diff().to_dataframe()
+
+    if section == "eda":
+        adf = pd.DataFrame(
+            {
+                "Original p-value": [adfuller(df[col])[1] for col in df.columns],
+                "Differenced p-value": [
+                    adfuller(df_diff[col])[1] for col in df_diff.columns
+                ],
+            },
+            index=df.columns,
+        )
+        corr = df_diff.corr()
+        tables = {
+            "Summary Statistics": df.describe(),
+            "ADF Test Results": adf,
+            "Correlation Matrix of Annual Changes": corr,
+        }
+        return tables, [plotly_correlation_heatmap(corr=corr)]
+
+    if section == "forecast":
+        forecast_df = models["levels"].forecast(steps)
+        return {"Forecasted Values (Liters per capita)": forecast_df}, [
+            plotly_forecast(df, forecast_df)
+        ]
+
+    if section == "backtest":
+        _, test = series.split(2019)
+        test_df = test.to_dataframe()
+        if test_df.empty:
+            return {}, []
+        backtest_df = generate_forecast(models["backtest"], steps=len(test_df))
+        errors = backtest_df.to_numpy() - test_df.to_numpy()
+        metrics = pd.DataFrame(
+            {
+                "MAE": np.abs(errors).mean(axis=0),
+                "RMSE": np.sqrt((errors**2).mean(axis=0)),
+            },
+            index=test_df.columns,
+        )
+        return {
+            "Forecasted Values": backtest_df,
+            "Actual Values": test_df,
+            "Forecast Errors": metrics,
+        }, [plotly_backtesting(test_df, backtest_df)]
+
+    if section == "irf":
+        irf = models["changes"].irf(steps)
+        cumulative = pd.DataFrame(
+            irf.cum_effects[-1].T,
+            index=[f"Shock to {col}" for col in df_diff.columns],
+            columns=df_diff.columns,
+        )
+        return {f"Cumulative Responses after {steps} Years": cumulative}, []
+
+    if section == "varx":
+        fitted_model = models["varx"]
+        effects = pd.DataFrame(
+            {
+                "Coefficient": fitted_model.params.loc["covid"],
+                "p-value": fitted_model.pvalues.loc["covid"],
+            }
+        )
+        return {"Effect of COVID-19 on Annual Changes": effects}, []
+
+    raise ValueError(f"Unknown report section '{section}'.")
+
+
+def render_section(
+    section: str,
+    tables: Dict[str, DataFrame],
+    figures: list,
+    fmt: str = "html",
+) -> str:
+    """
+    Renders the tables and figures of one section as an HTML or Markdown fragment.
+
+    Args:
+        section (str): One of `SECTIONS`.
+        tables (Dict[str, DataFrame]): The section's tables by title.
+        figures (list): The section's Plotly figures; only rendered in HTML.
+        fmt (str, optional): "html" or "md". Defaults to "html".
+
+    Returns:
+        str: The rendered fragment.
+    """
+    title = SECTION_TITLES[section]
+    if fmt == "html":
+        parts = [f"<h2>{escape(title)}</h2>"]
+        for fig in figures:
+            parts.append(fig.to_html(full_html=False, include_plotlyjs=False))
+        for table_title, table in tables.items():
+            parts.append(f"<h3>{escape(table_title)}</h3>")
+            parts.append(table.to_html(float_format="{:.3f}".format))
+        return "\n".join(parts)
+    if fmt == "md":
+        parts = [f"## {title}"]
+        for table_title, table in tables.items():
+            parts.append(f"### {table_title}")
+            parts.append(f"```\n{table.to_string(float_format='{:.3f}'.format)}\n```")
+        return "\n\n".join(parts)
+    raise ValueError(f"Unknown report format '{fmt}'.")
+
+
+def _data_hash(series: SeriesContainer) -> str:
+    digest = hashlib.sha256()
+    digest.update(np.ascontiguousarray(series.values, dtype=np.float64).tobytes())
+    digest.update(np.asarray(series.years, dtype=np.int64).tobytes())
+    digest.update("\0".join(series.columns).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class _ReportCache:
+    """
+    The fitted models, section outputs and rendered fragments of one entity,
+    pickled under `<cache_dir>/<entity>/<hash of its data>/` so they persist
+    across runs and are dropped as soon as the entity's data changes.
+    """
+
+    def __init__(
+        self, cache_dir: Optional[str], entity: str, series: SeriesContainer
+    ):
+        self._entity_dir = None
+        self._path = None
+        if cache_dir is not None:
+            self._entity_dir = os.path.join(cache_dir, entity)
+            self._path = os.path.join(self._entity_dir, _data_hash(series))
+        self._values: Dict[str, Any] = {}
+
+    def load(self, name: str) -> Any:
+        if name not in self._values and self._path is not None:
+            path = os.path.join(self._path, name)
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    self._values[name] = pickle.load(f)
+        return self._values.get(name)
+
+    def save(self, name: str, value: Any):
+        self._values[name] = value
+        if self._path is None:
+            return
+        if not os.path.isdir(self._path):
+            # Results for the entity's previous data can never be hit again
+            if os.path.isdir(self._entity_dir):
+                shutil.rmtree(self._entity_dir)
+            os.makedirs(self._path)
+        path = os.path.join(self._path, name)
+        # Write then rename, so an interrupted run never leaves a partial file
+        with open(path + ".tmp", "wb") as f:
+            pickle.dump(value, f)
+        os.replace(path + ".tmp", path)
+
+
+def _map(executor: Optional[ProcessPoolExecutor], fn, tasks: List[tuple]) -> list:
+    if executor is None or not tasks:
+        return [fn(*task) for task in tasks]
+    return list(executor.map(fn, *zip(*tasks)))
+
+
+def _assemble_report(entity: str, fragments: List[str], fmt: str) -> str:
+    title = f"Alcohol Consumption Report: {entity.title()}"
+    if fmt == "html":
+        body = "\n".join(fragments)
+        # Inline plotly.js once so the report is self-contained and always
+        # matches the installed Plotly version
+        return (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+            f"<title>{escape(title)}</title>\n"
+            f'<script type="text/javascript">{get_plotlyjs()}</script>\n'
+            f"</head>\n<body>\n<h1>{escape(title)}</h1>\n{body}\n</body>\n</html>\n"
+        )
+    return "\n\n".join([f"# {title}"] + fragments) + "\n"
+
+
+def build_reports(
+    store: DataStore,
+    entities: Optional[Sequence[str]] = None,
+    sections: Sequence[str] = SECTIONS,
+    fmt: str = "html",
+    steps: int = 5,
+    max_workers: Optional[int] = None,
+    output_dir: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> Dict[str, str]:
+    """
+    Builds a static report for each entity, computing sections in parallel.
+
+    Each model in `SECTION_MODELS` is fitted at most once per entity and shared
+    by every section that reads it; a `RecursiveVAR` registered in the store
+    as `LEVELS_ARTIFACT` is used instead of fitting the "levels" model. With a
+    `cache_dir`, fitted models, section outputs and rendered fragments are
+    kept on disk, keyed by entity, section, horizon, format and a hash of the
+    entity's data, so later runs only recompute entities whose data changed.
+
+    Args:
+        store (DataStore): The store holding the entities' series.
+        entities (Sequence[str], optional): The entities to report on.
+            Defaults to None, meaning every entity in the store.
+        sections (Sequence[str], optional): The sections to include. Defaults to SECTIONS.
+        fmt (str, optional): "html" or "md". Defaults to "html".
+        steps (int, optional): The forecast and IRF horizon. Defaults to 5.
+        max_workers (int, optional): The number of worker processes. Defaults
+            to None, which uses every CPU; 1 computes in the current process.
+        output_dir (str, optional): If given, each report is also written to
+            `<output_dir>/<entity>.<fmt>`. Defaults to None.
+        cache_dir (str, optional): The directory of the persistent cache.
+            Defaults to None, which caches nothing between calls.
+
+    Returns:
+        Dict[str, str]: The rendered report of each entity.
+    """
+    if fmt not in ("html", "md"):
+        raise ValueError(f"Unknown report format '{fmt}'.")
+    unknown = [section for section in sections if section not in SECTIONS]
+    if unknown:
+        raise ValueError(f"Unknown report sections {unknown}.")
+    entities = store.entities if entities is None else list(entities)
+    caches = {
+        entity: _ReportCache(cache_dir, entity, store.get(entity))
+        for entity in entities
+    }
+
+    def output_name(section: str) -> str:
+        return f"section-{section}-{steps}.pkl"
+
+    def fragment_name(section: str) -> str:
+        return f"fragment-{section}-{steps}.{fmt}.pkl"
+
+    pending = [
+        (entity, section)
+        for entity in entities
+        for section in sections
+        if caches[entity].load(fragment_name(section)) is None
+        and caches[entity].load(output_name(section)) is None
+    ]
+    models: Dict[Tuple[str, str], Any] = {}
+    for entity, section in pending:
+        for name in SECTION_MODELS[section]:
+            if name == "levels" and store.has_artifact(entity, LEVELS_ARTIFACT):
+                models[(entity, name)] = store.artifact(entity, LEVELS_ARTIFACT)
+            else:
+                models[(entity, name)] = caches[entity].load(f"model-{name}.pkl")
+    unfitted = [key for key, model in models.items() if model is None]
+
+    parallel = max_workers != 1 and len(pending) + len(unfitted) > 1
+    pool = ProcessPoolExecutor(max_workers) if parallel else nullcontext()
+    with pool as executor:
+        fitted = _map(
+            executor,
+            fit_model,
+            [(name, store.get(entity)) for entity, name in unfitted],
+        )
+        for (entity, name), model in zip(unfitted, fitted):
+            models[(entity, name)] = model
+            caches[entity].save(f"model-{name}.pkl", model)
+
+        outputs = _map(
+            executor,
+            compute_section,
+            [
+                (
+                    section,
+                    store.get(entity),
+                    steps,
+                    {name: models[(entity, name)] for name in SECTION_MODELS[section]},
+                )
+                for entity, section in pending
+            ],
+        )
+    for (entity, section), output in zip(pending, outputs):
+        caches[entity].save(output_name(section), output)
+
+    reports = {}
+    for entity in entities:
+        cache = caches[entity]
+        fragments = []
+        for section in sections:
+            fragment = cache.load(fragment_name(section))
+            if fragment is None:
+                tables, figures = cache.load(output_name(section))
+                fragment = render_section(section, tables, figures, fmt)
+                cache.save(fragment_name(section), fragment)
+            fragments.append(fragment)
+        reports[entity] = _assemble_report(entity, fragments, fmt)
+
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        for entity, report in reports.items():
+            path = os.path.join(output_dir, f"{entity}.{fmt}")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(report)
+    return reports
@@ -0,0 +1,170 @@
+from typing import List, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class SeriesContainer:
+    """
+    A lightweight container for yearly multivariate series.
+
+    Holds a contiguous 2-D float array of values, an integer year axis and
+    the column names. Differencing offsets, train/test splits and contiguous column
+    subsets are served as NumPy views, so the underlying data is only copied
+    when a new array is genuinely computed. Convert to pandas with
+    `to_dataframe` at the display edge.
+    """
+
+    __slots__ = ("values", "years", "columns")
+
+    def __init__(
+        self,
+        values: np.ndarray,
+        years: Sequence[int],
+        columns: Sequence[str],
+        dtype: Union[type, np.dtype] = np.float64,
+    ):
+        """
+        Args:
+            values (np.ndarray): A (years, columns) array of observations.
+            years (Sequence[int]): The year of each row, in ascending order.
+            columns (Sequence[str]): The name of each column.
+            dtype (type, optional): float64 or float32. Defaults to np.float64.
+        """
+        values = np.asarray(values, dtype=dtype)
+        if values.ndim != 2:
+            raise ValueError("values must be a 2-D array.")
+        years = np.asarray(years, dtype=np.int64)
+        if values.shape != (len(years), len(columns)):
+            raise ValueError(
+                f"values shape {values.shape} does not match "
+                f"{len(years)} years and {len(columns)} columns."
+            )
+        self.values = values
+        self.years = years
+        self.columns = list(columns)
+
+    @classmethod
+    def from_dataframe(
+        cls, df: DataFrame, dtype: Union[type, np.dtype] = np.float64
+    ) -> "SeriesContainer":
+        """
+        Builds a container from a DataFrame indexed by year or by yearly dates.
+
+        Args:
+            df (DataFrame): The input DataFrame.
+            dtype (type, optional): float64 or float32. Defaults to np.float64.
+
+        Returns:
+            SeriesContainer: The container holding the DataFrame's values.
+        """
+        index = df.index
+        years = index.year if isinstance(index, pd.DatetimeIndex) else index
+        values = np.ascontiguousarray(df.to_numpy(dtype=dtype))
+        return cls(values, years, df.columns, dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    def __repr__(self) -> str:
+        return (
+            f"SeriesContainer(rows={len(self)}, columns={self.columns}, "
+            f"dtype={self.values.dtype})"
+        )
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.values.shape
+
+    def _view(self, rows: slice, cols: slice = slice(None)) -> "SeriesContainer":
+        # Bypasses __init__ so basic slices stay views of the parent array
+        view = SeriesContainer.__new__(SeriesContainer)
+        view.values = self.values[rows, cols]
+        view.years = self.years[rows]
+        view.columns = self.columns[cols]
+        return view
+
+    def lagged_pair(
+        self, periods: int = 1
+    ) -> Tuple["SeriesContainer", "SeriesContainer"]:
+        """
+        Returns aligned views of the current and lagged observations.
+
+        Args:
+            periods (int, optional): The differencing offset. Defaults to 1.
+
+        Returns:
+            Tuple[SeriesContainer, SeriesContainer]: The rows from `periods`
+            onwards and the rows `periods` years earlier, both as views.
+        """
+        if periods < 1:
+            raise ValueError("periods must be a positive integer.")
+        return self._view(slice(periods, None)), self._view(slice(None, -periods))
+
+    def diff(self, periods: int = 1) -> "SeriesContainer":
+        """
+        Computes the differenced series without the leading missing rows.
+
+        Args:
+            periods (int, optional): The differencing offset. Defaults to 1.
+
+        Returns:
+            SeriesContainer: The differenced series.
+        """
+        current, lagged = self.lagged_pair(periods)
+        diff = self._view(slice(periods, None))
+        diff.values = np.subtract(current.values, lagged.values)
+        return diff
+
+    def split(self, last_train_year: int) -> Tuple["SeriesContainer", "SeriesContainer"]:
+        """
+        Splits the series into train and test views at a given year.
+
+        Args:
+            last_train_year (int): The last year included in the training set.
+
+        Returns:
+            Tuple[SeriesContainer, SeriesContainer]: The train and test views.
+        """
+        cut = int(np.searchsorted(self.years, last_train_year, side="right"))
+        return self._view(slice(None, cut)), self._view(slice(cut, None))
+
+    def select(self, columns: List[str]) -> "SeriesContainer":
+        """
+        Selects a subset of columns.
+
+        A view is returned when the requested columns are evenly spaced in the
+        stored order; any other selection has to copy the selected columns.
+
+        Args:
+            columns (List[str]): The column names to select.
+
+        Returns:
+            SeriesContainer: The container restricted to `columns`.
+        """
+        positions = [self.columns.index(column) for column in columns]
+        if not positions:
+            raise ValueError("Select at least one column.")
+        if len(positions) == 1:
+            return self._view(slice(None), slice(positions[0], positions[0] + 1))
+        step = positions[1] - positions[0]
+        if step > 0 and all(
+            b - a == step for a, b in zip(positions, positions[1:])
+        ):
+            return self._view(slice(None), slice(positions[0], positions[-1] + 1, step))
+        return SeriesContainer(
+            self.values[:, positions], self.years, columns, dtype=self.values.dtype
+        )
+
+    def to_dataframe(self) -> DataFrame:
+        """
+        Converts the container to a DataFrame indexed by yearly dates.
+
+        Returns:
+            DataFrame: The DataFrame sharing the container's values where possible.
+        """
+        index = pd.DatetimeIndex(
+            pd.to_datetime(self.years.astype(str), format="%Y"), name="Year"
+        )
+        return pd.DataFrame(self.values, index=index, columns=self.columns, copy=False)
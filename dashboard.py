@@ -1,14 +1,27 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 from analysis_lib.data_loader import load_and_prepare_data
-from analysis_lib.forecasting_models import train_var_model, generate_forecast
+from analysis_lib.series_container import SeriesContainer
+from analysis_lib.incremental_stats import OnlineCorrelation, OnlineTrendDecomposition
+from analysis_lib.forecasting_models import (
+    train_var_model,
+    generate_forecast,
+    get_forecast_index,
+    train_varx_model,
+    build_covid_exog,
+    build_shock_scenarios,
+    simulate_exog_scenarios,
+)
 # Import new plotly plotting library
 from analysis_lib.plotly_plotting import (
     plotly_correlation_heatmap,
+    plotly_animated_correlation_heatmap,
     plotly_forecast,
     plotly_trend_decomposition,
     plotly_backtesting,
     plotly_what_if_forecast,
+    plotly_scenario_fan,
 )
 
 # --- Page Configuration ---
@@ -25,11 +38,35 @@ def cached_load_data():
     return load_and_prepare_data()
 
 
+@st.cache_resource
+def cached_load_series():
+    return SeriesContainer.from_dataframe(cached_load_data())
+
+
+@st.cache_resource
+def cached_correlation(columns, window=None):
+    engine = OnlineCorrelation(columns, window)
+    engine.update(cached_load_series().select(list(columns)).diff())
+    return engine
+
+
+@st.cache_resource
+def cached_decomposition(columns):
+    engine = OnlineTrendDecomposition(columns)
+    engine.update(cached_load_series().select(list(columns)))
+    return engine
+
+
 @st.cache_resource
 def cached_train_model(_df):
     return train_var_model(_df)
 
 
+@st.cache_resource
+def cached_train_varx_model(df_diff, exog):
+    return train_varx_model(df_diff, exog)
+
+
 # --- Main Application ---
 st.title("🍾 Russian Alcohol Consumption Analysis Dashboard")
 st.markdown(
@@ -39,6 +76,7 @@ st.markdown(
 # --- Load Data ---
 try:
     df_full = cached_load_data()
+    series_full = cached_load_series()
 except FileNotFoundError:
     st.error("Error: The dataset file was not found.")
     st.stop()
@@ -56,6 +94,7 @@ if not selected_beverages:
     st.stop()
 
 df_selection = df_full[selected_beverages]
+series_selection = series_full.select(selected_beverages)
 
 # --- Main Tabs ---
 tabs = st.tabs(
@@ -64,6 +103,7 @@ tabs = st.tabs(
         "📈 Forecasting",
         "🔬 Backtesting",
         "❓ What-If Analysis",
+        "🧪 Policy Scenarios",
     ]
 )
 
@@ -78,10 +118,29 @@ with tabs[0]:
     with col1:
         st.subheader("Correlation Matrix")
         if len(df_selection.columns) > 1:
+            correlation = cached_correlation(tuple(selected_beverages))
             st.plotly_chart(
-                plotly_correlation_heatmap(df_selection.diff().dropna()),
+                plotly_correlation_heatmap(corr=correlation.latest()),
                 use_container_width=True,
             )
+            with st.expander("Correlation over time"):
+                # Two-point windows give only ±1 correlations, so start at 3
+                window = st.select_slider(
+                    "Rolling window (years):",
+                    options=["Expanding"] + list(range(3, 16)),
+                    value=8,
+                )
+                correlation_over_time = cached_correlation(
+                    tuple(selected_beverages), None if window == "Expanding" else window
+                )
+                st.plotly_chart(
+                    plotly_animated_correlation_heatmap(
+                        correlation_over_time.matrices,
+                        correlation_over_time.years,
+                        correlation_over_time.columns,
+                    ),
+                    use_container_width=True,
+                )
         else:
             st.info("Select at least two beverages to see their correlation.")
 
@@ -93,7 +152,11 @@ with tabs[0]:
         if beverage_to_decompose:
             st.plotly_chart(
                 plotly_trend_decomposition(
-                    df_selection[beverage_to_decompose], beverage_to_decompose
+                    df_selection[beverage_to_decompose],
+                    beverage_to_decompose,
+                    cached_decomposition(tuple(selected_beverages)).result(
+                        beverage_to_decompose
+                    ),
                 ),
                 use_container_width=True,
             )
@@ -124,8 +187,9 @@ with tabs[2]:
     if st.button("Run Backtest"):
         with st.spinner("Running backtest..."):
             # Split data
-            train_df = df_selection[df_selection.index.year <= 2019]
-            test_df = df_selection[df_selection.index.year > 2019]
+            train_series, test_series = series_selection.split(2019)
+            train_df = train_series.to_dataframe()
+            test_df = test_series.to_dataframe()
 
             # Train model on historical data only
             backtest_model = train_var_model(train_df)
@@ -166,7 +230,7 @@ with tabs[3]:
 
     # Create sliders for what-if scenario
     st.subheader("Simulate a Shock in 2023 Consumption")
-    df_hypothetical = df_selection.copy()
+    hypothetical_values = series_selection.values.copy()
 
     cols = st.columns(len(df_selection.columns))
     for i, col_name in enumerate(df_selection.columns):
@@ -179,7 +243,10 @@ with tabs[3]:
             step=0.1,
         )
         # Apply the shock to the last row
-        df_hypothetical.iloc[-1, df_hypothetical.columns.get_loc(col_name)] = shock_val
+        hypothetical_values[-1, i] = shock_val
+    df_hypothetical = SeriesContainer(
+        hypothetical_values, series_selection.years, series_selection.columns
+    ).to_dataframe()
 
     with st.spinner("Running what-if scenario..."):
         # Train a new model on the hypothetical data
@@ -199,4 +266,55 @@ with tabs[3]:
         st.dataframe(original_forecast)
     with col2:
         st.subheader("What-If Forecast")
-        st.dataframe(what_if_forecast)
\ No newline at end of file
+        st.dataframe(what_if_forecast)
+
+# --- Policy Scenarios Tab ---
+with tabs[4]:
+    st.header("Policy Scenario Simulation")
+    st.markdown(
+        """
+        A VARX model is fitted once on the annual changes in consumption, using the COVID-19 period 
+        (2020 onwards) as an exogenous policy shock. Each scenario applies a shock of a different size 
+        starting in a chosen forecast year, and all scenarios are forecast together in a single batch.
+        """
+    )
+
+    col1, col2 = st.columns(2)
+    with col1:
+        scenario_years = st.slider("Forecast horizon (years):", 1, 10, 5, 1)
+        n_scenarios = st.slider("Number of scenarios:", 10, 1000, 200, 10)
+    with col2:
+        shock_range = st.slider(
+            "Shock intensity (1.0 = COVID-19 sized regime):", -2.0, 2.0, (0.0, 1.0), 0.1
+        )
+        shock_start = (
+            st.slider("Shock starts in forecast year:", 1, scenario_years, 1, 1)
+            if scenario_years > 1
+            else 1
+        )
+
+    with st.spinner("Simulating scenarios..."):
+        df_diff = series_selection.diff().to_dataframe()
+        varx_model = cached_train_varx_model(df_diff, build_covid_exog(df_diff.index))
+
+        intensities = np.linspace(shock_range[0], shock_range[1], n_scenarios)
+        exog_scenarios = build_shock_scenarios(intensities, scenario_years, shock_start)
+
+        # Forecasts are annual changes; cumulate them onto the last observed level
+        scenario_changes = simulate_exog_scenarios(varx_model, exog_scenarios)
+        scenario_levels = df_selection.values[-1] + np.cumsum(scenario_changes, axis=1)
+        scenario_index = get_forecast_index(varx_model, scenario_years)
+
+        st.plotly_chart(
+            plotly_scenario_fan(df_selection, scenario_levels, scenario_index),
+            use_container_width=True,
+        )
+
+    st.subheader("Median Scenario Forecast (Liters per capita)")
+    st.dataframe(
+        pd.DataFrame(
+            np.median(scenario_levels, axis=0),
+            index=scenario_index,
+            columns=df_selection.columns,
+        )
+    )
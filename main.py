@@ -1,13 +1,23 @@
 import matplotlib.pyplot as plt
 import numpy as np
+import pandas as pd
 from statsmodels.tsa.api import VAR
 from statsmodels.tsa.stattools import adfuller
 
-from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.data_loader import (
+    load_measures,
+    stack_measures,
+    compute_ethanol_aggregates,
+)
 from analysis_lib.forecasting_models import (
     train_var_model,
     generate_forecast,
-    train_varmax_model,
+    train_varx_model,
+    build_covid_exog,
+    build_shock_scenarios,
+    simulate_exog_scenarios,
+    train_var_batch,
+    forecast_var_batch,
 )
 from analysis_lib.plotting import (
     plot_correlation_heatmap,
@@ -23,7 +33,8 @@ def main():
     """
     # --- 1. Data Loading and Preparation ---
     print("Loading and preparing data...")
-    df = load_and_prepare_data()
+    df_measures = load_measures()
+    df = df_measures["liters"].copy()
     print("Data loaded successfully.")
     print(df.head())
 
@@ -65,21 +76,37 @@ def main():
     print("Forecast generated successfully.")
     print(forecast_df)
 
+    print("\nForecasting liters and pure alcohol per capita together...")
+    stacked = stack_measures(df_measures)
+    measure_forecasts = forecast_var_batch(stacked, train_var_batch(stacked), steps=5)
+    pure_alcohol_forecast = pd.DataFrame(
+        measure_forecasts[1], index=forecast_df.index, columns=df.columns
+    )
+    print(pure_alcohol_forecast)
+
+    print("\nTotal consumption and implied alcohol strength (ABV, %):")
+    print(compute_ethanol_aggregates(df_measures).tail())
+
     print("\nPlotting the forecast...")
     fig_forecast = plot_forecast(df, forecast_df)
     plt.show()
 
     # --- 5. VARMAX Model Experiment ---
-    print("\nTraining VARMAX model to account for COVID-19...")
-    df["covid"] = np.where(df.index.year >= 2020, 1, 0)
-    df_diff_covid = df.diff().dropna()
-    endog_vars = ["wine", "beer", "vodka", "brandy"]
-    exog_vars = ["covid"]
-    fitted_varmax_model = train_varmax_model(
-        df_diff_covid[endog_vars], df_diff_covid[exog_vars]
-    )
-    print(fitted_varmax_model.summary())
-    print("\nVARMAX model training complete.")
+    print("\nTraining VARX model to account for COVID-19...")
+    varx_model = train_varx_model(df_diff, build_covid_exog(df_diff.index))
+    print(varx_model.summary())
+    print("\nVARX model training complete.")
+
+    # --- 6. Policy Scenario Simulation ---
+    print("\nSimulating COVID-19 sized shocks of varying intensity...")
+    intensities = np.linspace(0.0, 1.0, 11)
+    exog_scenarios = build_shock_scenarios(intensities, steps=5)
+    scenario_changes = simulate_exog_scenarios(varx_model, exog_scenarios)
+    scenario_levels = df.values[-1] + np.cumsum(scenario_changes, axis=1)
+    for intensity, levels in zip(intensities, scenario_levels[:, -1]):
+        print(f"Shock intensity {intensity:.1f}: " + ", ".join(
+            f"{name} = {value:.2f}" for name, value in zip(df.columns, levels)
+        ))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,49 @@
+import argparse
+
+from analysis_lib.data_store import DataStore
+from analysis_lib.report_builder import SECTIONS, build_reports
+
+
+def main():
+    """
+    Builds static analysis reports from the command line.
+    """
+    parser = argparse.ArgumentParser(
+        description="Build static alcohol consumption reports."
+    )
+    parser.add_argument(
+        "--data",
+        default="Consumption of alcoholic beverages in Russia 1998-2023.csv",
+        help="Path to the consumption CSV file.",
+    )
+    parser.add_argument("--format", choices=["html", "md"], default="html")
+    parser.add_argument("--sections", nargs="+", choices=SECTIONS, default=SECTIONS)
+    parser.add_argument("--steps", type=int, default=5, help="Forecast horizon.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--output-dir", default="reports")
+    parser.add_argument(
+        "--cache-dir",
+        default=".report_cache",
+        help="Directory of fitted models and sections reused across runs.",
+    )
+    args = parser.parse_args()
+
+    store = DataStore.from_csv(args.data)
+    reports = build_reports(
+        store,
+        sections=args.sections,
+        fmt=args.format,
+        steps=args.steps,
+        max_workers=args.workers,
+        output_dir=args.output_dir,
+        cache_dir=args.cache_dir,
+    )
+    for entity in reports:
+        print(
+            f"Report for {entity} written to "
+            f"{args.output_dir}/{entity}.{args.format}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,12 @@
 import unittest
+import numpy as np
 import pandas as pd
-from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.data_loader import (
+    load_and_prepare_data,
+    load_measures,
+    stack_measures,
+    compute_ethanol_aggregates,
+)
 
 
 class TestDataLoader(unittest.TestCase):
@@ -17,6 +23,43 @@ class TestDataLoader(unittest.TestCase):
         self.assertIn("vodka", df.columns)
         self.assertIn("brandy", df.columns)
 
+    def test_load_measures(self):
+        """
+        Test that both measures are loaded and stacked as (measure, year, beverage).
+        """
+        df_measures = load_measures()
+        stacked = stack_measures(df_measures)
+        self.assertEqual(stacked.shape, (2, len(df_measures), 4))
+        np.testing.assert_array_equal(stacked[0], df_measures["liters"].to_numpy())
+        np.testing.assert_array_equal(
+            stacked[1], df_measures["pure_alcohol"].to_numpy()
+        )
+
+    def test_stack_measures_subset(self):
+        """
+        Test that column subsets are stacked by the measures they actually hold.
+        """
+        df_measures = load_measures()
+        stacked = stack_measures(df_measures[["liters"]])
+        self.assertEqual(stacked.shape, (1, len(df_measures), 4))
+        np.testing.assert_array_equal(stacked[0], df_measures["liters"].to_numpy())
+        with self.assertRaises(ValueError):
+            stack_measures(df_measures.iloc[:, :5])
+
+    def test_compute_ethanol_aggregates(self):
+        """
+        Test the total consumption and implied alcohol strength columns.
+        """
+        df_measures = load_measures()
+        aggregates = compute_ethanol_aggregates(df_measures)
+        np.testing.assert_allclose(
+            aggregates["total_pure_alcohol"], df_measures["pure_alcohol"].sum(axis=1)
+        )
+        np.testing.assert_allclose(
+            aggregates["abv_vodka"],
+            100 * df_measures["pure_alcohol"]["vodka"] / df_measures["liters"]["vodka"],
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
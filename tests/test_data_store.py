@@ -0,0 +1,118 @@
+import unittest
+import numpy as np
+from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.data_store import DataStore
+from analysis_lib.forecasting_models import RecursiveVAR, train_var_model
+from analysis_lib.incremental_stats import OnlineCorrelation
+from analysis_lib.series_container import SeriesContainer
+
+
+class TestDataStore(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a store holding the data up to 2015 and the rows that follow it.
+        """
+        self.df = load_and_prepare_data()
+        history, self.new_rows = SeriesContainer.from_dataframe(self.df).split(2015)
+        self.store = DataStore()
+        self.store.add_entity("russia", history)
+
+    def test_append(self):
+        """
+        Test that appending year by year reproduces the full series.
+        """
+        for year in self.new_rows.years:
+            self.store.append("russia", self.new_rows.split(year - 1)[1].split(year)[0])
+        series = self.store.get("russia")
+        np.testing.assert_array_equal(series.years, self.df.index.year)
+        np.testing.assert_array_equal(series.values, self.df.to_numpy())
+        with self.assertRaises(ValueError):
+            self.store.append("russia", self.new_rows)
+
+    def test_registered_artifacts_are_refreshed(self):
+        """
+        Test that registered models and statistics match a full refit after an append.
+        """
+        self.store.register(
+            "russia", "var", RecursiveVAR.from_series(self.store.get("russia"))
+        )
+        correlation = OnlineCorrelation(self.df.columns)
+        correlation.update(self.store.get("russia").diff())
+        self.store.register("russia", "correlation", correlation, differenced=True)
+        self.store.append("russia", self.new_rows)
+
+        fitted_model = train_var_model(self.df)
+        np.testing.assert_allclose(
+            self.store.artifact("russia", "var").params,
+            fitted_model.params,
+            atol=1e-8,
+        )
+        np.testing.assert_allclose(
+            self.store.artifact("russia", "correlation").latest(),
+            self.df.diff().dropna().corr(),
+        )
+
+    def test_differenced_artifact_on_empty_entity(self):
+        """
+        Test that the first append to an empty entity feeds every difference.
+        """
+        history = self.store.get("russia")
+        empty = SeriesContainer(
+            np.empty((0, len(history.columns))), [], history.columns
+        )
+        self.store.add_entity("new", empty)
+        correlation = OnlineCorrelation(history.columns)
+        self.store.register("new", "correlation", correlation, differenced=True)
+        self.store.append("new", history)
+        self.assertEqual(len(correlation.matrices), len(history) - 1)
+        np.testing.assert_array_equal(correlation.years, history.years[1:])
+
+    def test_append_empty_batch(self):
+        """
+        Test that an empty batch is a no-op for the store and its models.
+        """
+        model = RecursiveVAR.from_series(self.store.get("russia"))
+        self.store.register("russia", "var", model)
+        self.store.append("russia", self.new_rows.split(2000)[0])
+        self.assertEqual(len(self.store.get("russia")), 18)
+        self.assertEqual(model.last_year, 2015)
+
+    def test_failed_artifact_update_leaves_store_unchanged(self):
+        """
+        Test that a failing artifact rolls back the append and other artifacts.
+        """
+
+        class FailingArtifact:
+            def update(self, series):
+                raise RuntimeError("update failed")
+
+        self.store.register(
+            "russia", "var", RecursiveVAR.from_series(self.store.get("russia"))
+        )
+        self.store.register("russia", "failing", FailingArtifact())
+        with self.assertRaises(RuntimeError):
+            self.store.append("russia", self.new_rows)
+        self.assertEqual(len(self.store.get("russia")), 18)
+        self.assertEqual(self.store.artifact("russia", "var").last_year, 2015)
+
+    def test_cache_invalidated_only_for_appended_entity(self):
+        """
+        Test that an append drops cached results of that entity only.
+        """
+        self.store.add_entity("other", self.store.get("russia"))
+        calls = []
+
+        def compute(series):
+            calls.append(series)
+            return len(series)
+
+        self.assertEqual(self.store.cached("russia", "rows", compute), 18)
+        self.assertEqual(self.store.cached("other", "rows", compute), 18)
+        self.store.append("russia", self.new_rows)
+        self.assertEqual(self.store.cached("russia", "rows", compute), 26)
+        self.assertEqual(self.store.cached("other", "rows", compute), 18)
+        self.assertEqual(len(calls), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,21 @@
 import unittest
+import numpy as np
 import pandas as pd
-from analysis_lib.data_loader import load_and_prepare_data
-from analysis_lib.forecasting_models import train_var_model, generate_forecast
+from analysis_lib.data_loader import (
+    load_and_prepare_data,
+    load_measures,
+    stack_measures,
+)
+from analysis_lib.forecasting_models import (
+    train_var_model,
+    generate_forecast,
+    train_varx_model,
+    build_covid_exog,
+    build_shock_scenarios,
+    simulate_exog_scenarios,
+    train_var_batch,
+    forecast_var_batch,
+)
 from statsmodels.tsa.vector_ar.var_model import VARResultsWrapper
 
 
@@ -29,6 +43,37 @@ class TestForecastingModels(unittest.TestCase):
         self.assertEqual(len(forecast_df), 5)
         self.assertEqual(len(forecast_df.columns), 4)
 
+    def test_simulate_exog_scenarios(self):
+        """
+        Test that batched scenario forecasts match per-scenario VARX forecasts.
+        """
+        df_diff = self.df.diff().dropna()
+        fitted_model = train_varx_model(df_diff, build_covid_exog(df_diff.index))
+        exog_scenarios = build_shock_scenarios(np.linspace(0, 1, 6), steps=3)
+        forecasts = simulate_exog_scenarios(fitted_model, exog_scenarios)
+        self.assertEqual(forecasts.shape, (6, 3, 4))
+        for scenario, exog_path in zip(forecasts, exog_scenarios):
+            expected = fitted_model.forecast(
+                fitted_model.endog[-1:], steps=3, exog_future=exog_path
+            )
+            np.testing.assert_allclose(scenario, expected)
+
+    def test_var_batch(self):
+        """
+        Test that the batched fit and forecast match one VAR model per measure.
+        """
+        df_measures = load_measures()
+        stacked = stack_measures(df_measures)
+        params = train_var_batch(stacked)
+        forecasts = forecast_var_batch(stacked, params, steps=5)
+        self.assertEqual(forecasts.shape, (2, 5, 4))
+        for i, measure in enumerate(["liters", "pure_alcohol"]):
+            fitted_model = train_var_model(df_measures[measure])
+            np.testing.assert_allclose(params[i], fitted_model.params, atol=1e-10)
+            np.testing.assert_allclose(
+                forecasts[i], generate_forecast(fitted_model, steps=5), atol=1e-10
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
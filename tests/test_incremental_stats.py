@@ -0,0 +1,75 @@
+import unittest
+import numpy as np
+from statsmodels.tsa.seasonal import seasonal_decompose
+from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.series_container import SeriesContainer
+from analysis_lib.incremental_stats import OnlineCorrelation, OnlineTrendDecomposition
+
+
+class TestIncrementalStats(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up the test data.
+        """
+        self.df = load_and_prepare_data()
+        self.series = SeriesContainer.from_dataframe(self.df)
+
+    def test_expanding_correlation(self):
+        """
+        Test that appending in two batches matches the pandas expanding correlation.
+        """
+        series_diff = self.series.diff()
+        engine = OnlineCorrelation(series_diff.columns)
+        for part in series_diff.split(2010):
+            engine.update(part)
+        expected = series_diff.to_dataframe().expanding().corr().to_numpy()
+        np.testing.assert_allclose(engine.matrices, expected.reshape(-1, 4, 4))
+
+    def test_rolling_correlation(self):
+        """
+        Test that appending in two batches matches the pandas rolling correlation.
+        """
+        series_diff = self.series.diff()
+        engine = OnlineCorrelation(series_diff.columns, window=5)
+        for part in series_diff.split(2010):
+            engine.update(part)
+        expected = series_diff.to_dataframe().rolling(5).corr().to_numpy()
+        np.testing.assert_allclose(engine.matrices, expected.reshape(-1, 4, 4))
+        self.assertEqual(engine.years[-1], 2023)
+
+    def test_rolling_correlation_constant_window(self):
+        """
+        Test that windows of equal differences give NaN rather than rounding noise.
+        """
+        series_diff = self.series.diff()
+        engine = OnlineCorrelation(series_diff.columns, window=2)
+        for part in series_diff.split(2010):
+            engine.update(part)
+        # Rounding removes the differencing noise so pandas sees exactly
+        # constant windows; its -inf from 0 / 0 cancellation is undefined too
+        expected = series_diff.to_dataframe().round(10).rolling(2).corr().to_numpy()
+        expected[np.isinf(expected)] = np.nan
+        np.testing.assert_allclose(
+            engine.matrices, expected.reshape(-1, 4, 4), rtol=1e-6
+        )
+        self.assertTrue(np.isnan(engine.matrices[18, 0, 0]))
+
+    def test_trend_decomposition(self):
+        """
+        Test that the incremental decomposition matches seasonal_decompose.
+        """
+        for period in (1, 3, 4):
+            engine = OnlineTrendDecomposition(self.series.columns, period=period)
+            for part in self.series.split(2010):
+                engine.update(part)
+            result = engine.result("beer")
+            expected = seasonal_decompose(
+                self.df["beer"], model="additive", period=period
+            )
+            np.testing.assert_allclose(result.trend, expected.trend)
+            np.testing.assert_allclose(result.seasonal, expected.seasonal)
+            np.testing.assert_allclose(result.resid, expected.resid)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.data_store import DataStore
+from analysis_lib.forecasting_models import RecursiveVAR
+from analysis_lib.report_builder import (
+    LEVELS_ARTIFACT,
+    SECTION_TITLES,
+    build_reports,
+    compute_section,
+)
+from analysis_lib.series_container import SeriesContainer
+
+
+class TestReportBuilder(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a store with two entities.
+        """
+        history, self.new_rows = SeriesContainer.from_dataframe(
+            load_and_prepare_data()
+        ).split(2021)
+        self.store = DataStore()
+        self.store.add_entity("russia", history)
+        self.store.add_entity("other", history)
+
+    def test_build_reports(self):
+        """
+        Test that parallel and serial builds agree and cover every section.
+        """
+        serial_store = DataStore()
+        for entity in self.store.entities:
+            serial_store.add_entity(entity, self.store.get(entity))
+
+        parallel = build_reports(self.store, fmt="md", max_workers=2)
+        serial = build_reports(serial_store, fmt="md", max_workers=1)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(set(parallel), {"russia", "other"})
+        positions = [
+            parallel["russia"].index(f"## {title}")
+            for title in SECTION_TITLES.values()
+        ]
+        self.assertEqual(positions, sorted(positions))
+
+    def test_cache_persists_across_runs(self):
+        """
+        Test that a fresh store reuses the on-disk cache of unchanged entities.
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            before = build_reports(
+                self.store, fmt="md", max_workers=1, cache_dir=cache_dir
+            )
+            other_dir = os.path.join(cache_dir, "other")
+            russia_dir = os.path.join(cache_dir, "russia")
+            other_files = {
+                name: os.stat(os.path.join(root, name)).st_mtime_ns
+                for root, _, names in os.walk(other_dir)
+                for name in names
+            }
+            self.assertIn("model-levels.pkl", other_files)
+            russia_hashes = os.listdir(russia_dir)
+
+            # A new store with the same data, as in a later run of report.py
+            next_run = DataStore()
+            for entity in self.store.entities:
+                next_run.add_entity(entity, self.store.get(entity))
+            next_run.append("russia", self.new_rows)
+            after = build_reports(
+                next_run, fmt="md", max_workers=1, cache_dir=cache_dir
+            )
+
+            self.assertEqual(before["other"], after["other"])
+            self.assertNotEqual(before["russia"], after["russia"])
+            self.assertEqual(
+                other_files,
+                {
+                    name: os.stat(os.path.join(root, name)).st_mtime_ns
+                    for root, _, names in os.walk(other_dir)
+                    for name in names
+                },
+            )
+            self.assertEqual(len(os.listdir(russia_dir)), 1)
+            self.assertNotEqual(os.listdir(russia_dir), russia_hashes)
+
+    def test_registered_model_is_used(self):
+        """
+        Test that the forecast section reads a VAR registered in the store.
+        """
+        model = RecursiveVAR.from_series(self.store.get("russia"))
+        model.params[0] += 1.0
+        self.store.register("russia", LEVELS_ARTIFACT, model)
+        tables, _ = compute_section("forecast", self.store.get("russia"))
+        report = build_reports(
+            self.store, sections=["forecast"], fmt="md", max_workers=1
+        )
+        expected = model.forecast(5).to_string(float_format="{:.3f}".format)
+        self.assertIn(expected, report["russia"])
+        self.assertNotIn(expected, report["other"])
+        self.assertNotIn(
+            tables["Forecasted Values (Liters per capita)"].to_string(
+                float_format="{:.3f}".format
+            ),
+            report["russia"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+import pandas as pd
+from analysis_lib.data_loader import load_and_prepare_data
+from analysis_lib.series_container import SeriesContainer
+
+
+class TestSeriesContainer(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up the test data.
+        """
+        self.df = load_and_prepare_data()
+        self.series = SeriesContainer.from_dataframe(self.df)
+
+    def test_diff(self):
+        """
+        Test that diff matches the pandas differenced DataFrame.
+        """
+        df_diff = self.series.diff().to_dataframe()
+        pd.testing.assert_frame_equal(
+            df_diff, self.df.diff().dropna(), check_freq=False, check_names=False
+        )
+
+    def test_split_returns_views(self):
+        """
+        Test that the train/test split shares memory with the container.
+        """
+        train, test = self.series.split(2019)
+        self.assertEqual(train.years[-1], 2019)
+        self.assertEqual(test.years[0], 2020)
+        self.assertEqual(len(train) + len(test), len(self.series))
+        self.assertTrue(np.shares_memory(train.values, self.series.values))
+        self.assertTrue(np.shares_memory(test.values, self.series.values))
+
+    def test_select(self):
+        """
+        Test that evenly spaced column subsets are views and others are copies.
+        """
+        view = self.series.select(["wine", "vodka"])
+        self.assertEqual(view.columns, ["wine", "vodka"])
+        self.assertTrue(np.shares_memory(view.values, self.series.values))
+        copy = self.series.select(["brandy", "wine"])
+        self.assertEqual(copy.columns, ["brandy", "wine"])
+        np.testing.assert_array_equal(
+            copy.values, self.df[["brandy", "wine"]].to_numpy()
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()